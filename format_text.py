@@ -3,100 +3,156 @@
 Script to reformat text by adding line breaks after approximately 15 words
 """
 
+try:
+    import numba
+    import numpy as np
+except ImportError:  # numba is optional; the pure-Python path covers everything
+    numba = None
+
+# Precomputed once at module scope; str.startswith accepts a tuple, so the
+# per-line header check stays on the native C fast path
+_HEADERS = ('Date:', 'Name:', 'URL:', 'Reason:')
+_SEP = '===='
+
+
+def _chunk_words(words, words_per_line):
+    """Group a pre-split word list into lines of at most words_per_line words."""
+    return [
+        ' '.join(words[i:i + words_per_line])
+        for i in range(0, len(words), words_per_line)
+    ]
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _space_break_offsets(buf, words_per_line):
+        """Byte offsets of every words_per_line-th space in a uint8 buffer."""
+        offsets = np.empty(buf.size // words_per_line + 1, dtype=np.int64)
+        n = 0
+        spaces = 0
+        for i in range(buf.size):
+            if buf[i] == 32:  # ' '
+                spaces += 1
+                if spaces % words_per_line == 0:
+                    offsets[n] = i
+                    n += 1
+        return offsets[:n]
+
+    # Pay the one-off JIT compile at import time (cached on disk after that)
+    # so the first real line doesn't stall on compilation
+    _space_break_offsets(np.frombuffer(b"a b", dtype=np.uint8), 1)
+
+# Only lines at least this long take the JIT path; below it the Python
+# slicing chunker wins because of the encode/decode round-trip
+_NUMBA_MIN_LEN = 4096
+
+
+def _chunk_text(text, words_per_line):
+    """Chunk a run of text into lines of at most words_per_line words.
+
+    Very long single-spaced lines go through a Numba kernel (when numba is
+    installed) that scans the raw bytes for break positions instead of
+    splitting into a word list; everything else uses _chunk_words. UTF-8 is
+    safe to scan bytewise because the space byte never appears inside a
+    multi-byte sequence.
+    """
+    if (
+        numba is not None
+        and len(text) >= _NUMBA_MIN_LEN
+        and '  ' not in text
+        and '\t' not in text
+        and text[:1] != ' '
+        and text[-1:] != ' '
+    ):
+        buf = bytearray(text.encode('utf-8'))
+        offsets = _space_break_offsets(
+            np.frombuffer(bytes(buf), dtype=np.uint8), words_per_line
+        )
+        for offset in offsets:
+            buf[offset] = 10  # '\n'
+        return bytes(buf).decode('utf-8').split('\n')
+
+    words = text.split()
+    if len(words) <= words_per_line:
+        return [text]
+    return _chunk_words(words, words_per_line)
+
+
+def format_line(line, words_per_line=15):
+    """
+    Format a single input line, preserving separators and headers.
+
+    Each line is independent, so callers can stream a file through this
+    one line at a time instead of loading it all into memory.
+
+    Args:
+        line (str): Input line without its trailing newline
+        words_per_line (int): Target number of words per line
+
+    Returns:
+        list: 1..N output lines
+    """
+    # Keep empty lines and separator lines as-is
+    if not line.strip() or line.strip().startswith(_SEP):
+        return [line]
+
+    # Check if this is a header line (Date:, Name:, URL:, Reason:)
+    if line.startswith(_HEADERS):
+        # Split the content after the header
+        header_part, content_part = line.split(':', 1)
+        content_part = content_part.strip()
+
+        if not content_part:
+            return [line]
+
+        # Break up the content part, keeping the header on the first line
+        content_lines = _chunk_text(content_part, words_per_line)
+        return [f"{header_part}: {content_lines[0]}"] + content_lines[1:]
+
+    # For non-header lines, break them up if they're too long
+    return _chunk_text(line, words_per_line)
+
+
 def format_text_with_line_breaks(text, words_per_line=15):
     """
     Format text by adding line breaks after approximately the specified number of words,
     while preserving the structure of the document (keeping separators and headers intact)
-    
+
     Args:
         text (str): Input text to format
         words_per_line (int): Target number of words per line
-    
+
     Returns:
         str: Formatted text with line breaks
     """
-    lines = text.split('\n')
-    formatted_lines = []
-    
-    for line in lines:
-        # Skip empty lines and separator lines
-        if not line.strip() or line.strip().startswith('===='):
-            formatted_lines.append(line)
-            continue
-            
-        # Check if this is a header line (Date:, Name:, URL:, Reason:)
-        if any(line.startswith(header) for header in ['Date:', 'Name:', 'URL:', 'Reason:']):
-            # Split the content after the header
-            if ':' in line:
-                header_part, content_part = line.split(':', 1)
-                content_part = content_part.strip()
-                
-                if content_part:
-                    # Break up the content part into lines
-                    words = content_part.split()
-                    content_lines = []
-                    current_line = []
-                    
-                    for word in words:
-                        current_line.append(word)
-                        if len(current_line) >= words_per_line:
-                            content_lines.append(' '.join(current_line))
-                            current_line = []
-                    
-                    # Add any remaining words
-                    if current_line:
-                        content_lines.append(' '.join(current_line))
-                    
-                    # Add the header with the first line of content
-                    if content_lines:
-                        formatted_lines.append(f"{header_part}: {content_lines[0]}")
-                        # Add remaining content lines with proper indentation
-                        for content_line in content_lines[1:]:
-                            formatted_lines.append(content_line)
-                    else:
-                        formatted_lines.append(line)
-                else:
-                    formatted_lines.append(line)
-            else:
-                formatted_lines.append(line)
-        else:
-            # For non-header lines, break them up if they're too long
-            words = line.split()
-            if len(words) > words_per_line:
-                current_line = []
-                for word in words:
-                    current_line.append(word)
-                    if len(current_line) >= words_per_line:
-                        formatted_lines.append(' '.join(current_line))
-                        current_line = []
-                
-                if current_line:
-                    formatted_lines.append(' '.join(current_line))
-            else:
-                formatted_lines.append(line)
-    
-    return '\n'.join(formatted_lines)
+    return '\n'.join(
+        out
+        for line in text.split('\n')
+        for out in format_line(line, words_per_line)
+    )
 
 def main():
     input_file = 'recommended_candidates.txt'
     output_file = 'formatted_candidates.txt'
     
     try:
-        # Read the input file
-        with open(input_file, 'r', encoding='utf-8') as file:
-            content = file.read()
-        
-        # Format the content
-        formatted_content = format_text_with_line_breaks(content, words_per_line=15)
-        
-        # Write to output file
-        with open(output_file, 'w', encoding='utf-8') as file:
-            file.write(formatted_content)
-        
+        # Stream line by line: memory stays O(one line) no matter how long
+        # the candidate log grows
+        word_count = 0
+        line_count = 0
+        with open(input_file, 'r', encoding='utf-8') as fin, \
+                open(output_file, 'w', encoding='utf-8') as fout:
+            for line in fin:
+                word_count += len(line.split())
+                for out in format_line(line.rstrip('\n'), words_per_line=15):
+                    fout.write(out)
+                    fout.write('\n')
+                    line_count += 1
+
         print(f"Successfully formatted text from '{input_file}' and saved to '{output_file}'")
-        print(f"Original file had {len(content.split())} words")
-        print(f"Formatted into {len(formatted_content.split(chr(10)))} lines")
-        
+        print(f"Original file had {word_count} words")
+        print(f"Formatted into {line_count} lines")
+
     except FileNotFoundError:
         print(f"Error: Could not find '{input_file}' in the current directory")
     except Exception as e:
@@ -8,18 +8,255 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
+import asyncio
+import atexit
+import hashlib
+import httpx
+import json
 import ollama
-import time
+import os
+import queue
 import re
+import shelve
+import textwrap
+import threading
 from typing import Optional, Tuple
 
+# How many verify-pass requests run concurrently (the first pass is one
+# batched call). The Ollama server only serves requests in parallel if it
+# was started with OLLAMA_NUM_PARALLEL >= this value (see README), otherwise
+# the extra requests just queue up server-side.
+CONCURRENT_PROFILES = 4
+
+# How many scraped profiles go into a single first-pass generate call. One
+# forward pass over 8 stacked profiles costs far less than 8 separate
+# requests' worth of HTTP and prefill overhead.
+BATCH_SIZE = 8
+
+# Model cascade: every profile goes through the small fast model first
+# (Ollama's llama3.2:3b ships as Q4_K_M), and only the rare YES verdicts are
+# re-checked with the big model. Most profiles are NO, so the 32B model
+# almost never runs and the average per-profile compute drops ~10x.
+FAST_MODEL = "llama3.2:3b"
+VERIFY_MODEL = "qwen2.5:32b"
+
+# Inference backend: "ollama" (default) or "llama-server" (llama.cpp's HTTP
+# server), selected via environment so no code changes are needed to swap.
+# llama-server serves whatever single model it was started with, so the
+# fast/verify cascade collapses to that one model (see README).
+LLM_BACKEND = os.environ.get("LLM_BACKEND", "ollama")
+LLM_HOST = os.environ.get(
+    "LLM_HOST",
+    "http://localhost:8080" if LLM_BACKEND == "llama-server" else "http://localhost:11434",
+)
+
+# One client per backend, constructed once and shared by every call: each
+# ollama.Client owns an httpx connection pool, so rebuilding it per call
+# would pay client setup plus a fresh TCP handshake every time instead of
+# reusing the kept-alive connection
+async_client = ollama.AsyncClient(host=LLM_HOST)
+sync_client = ollama.Client(host=LLM_HOST)
+llama_server_client = httpx.AsyncClient(base_url=LLM_HOST, timeout=120.0)
+
+# Static instruction block, kept verbatim at the very start of every prompt
+# (no interpolation inside it) so Ollama's KV prefix cache can reuse its
+# prefill across profiles - only the profile text appended after it changes.
+# Deliberately terse: prefill cost is linear in prompt tokens.
+SYSTEM_PROMPT = textwrap.dedent("""
+    Decide if this person has CONCRETE, VERIFIABLE EXPERIENCE (a specific job,
+    company, project, degree, competition, or research) in either category:
+    1. ROBOTICS, any type (need not be medical): robotics engineering, built
+       robots, robotics competitions/coursework/degrees, mechatronics.
+    2. MEDICAL/BIOTECH/HEALTHCARE, any type (need not be robotics): jobs at
+       healthcare/biotech/pharma companies, medical products or devices,
+       clinical work, medtech startups, bioinformatics/medical research,
+       degrees in biomedical or medical fields.
+
+    Answer false for: interests or aspirations without actual work; general
+    mechanical/electrical/software engineering or AI not applied to robotics
+    or healthcare; wellness/fitness/nutrition apps. If you cannot name a
+    specific project, job, or degree in either category, answer false.
+
+    Respond as JSON: "name" (person's name or "Unknown"), "experience"
+    (true/false), "summary" (the specific experience found, or that only
+    general interest was mentioned).
+    """).strip()
+
+# Schema handed to Ollama's structured-output mode (format=, Ollama >= 0.5):
+# decoding is constrained to this shape, so the response always parses and
+# the model can't ramble past the three fields
+RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "experience": {"type": "boolean"},
+        "summary": {"type": "string"},
+    },
+    "required": ["name", "experience", "summary"],
+}
+
+# Batched variant: one entry per profile, in order
+BATCH_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "results": {"type": "array", "items": RESPONSE_SCHEMA},
+    },
+    "required": ["results"],
+}
+
+# Generation settings shared by every call: a fixed context size, greedy
+# sampling (this is a classifier - determinism beats diversity, and no
+# sampling work per token), and a decode cap as a backstop against runaway
+# generation. Decode cost is per-token, so the cap bounds worst-case latency.
+GENERATE_OPTIONS = {
+    "num_ctx": 4096,
+    "temperature": 0,
+    "top_k": 1,
+    "top_p": 1,
+    "repeat_penalty": 1.0,
+    "num_predict": 128,
+}
+
+# Keep the model loaded (and its prefix cache warm) between profiles
+KEEP_ALIVE = "30m"
+
+# Bump whenever SYSTEM_PROMPT changes so cached verdicts from the old
+# instructions are invalidated
+PROMPT_VERSION = "1"
+
+# Persistent verdict cache: repeated profiles (re-surfaced by the site, or
+# re-analyzed across debugging sessions) skip the LLM entirely. Opened on
+# first use so importing this module doesn't create database files.
+_verdict_cache = None
+
+
+def _get_verdict_cache() -> shelve.Shelf:
+    global _verdict_cache
+    if _verdict_cache is None:
+        _verdict_cache = shelve.open("llm_cache")
+        atexit.register(_verdict_cache.close)
+    return _verdict_cache
+
+
+def _cache_key(model_name: str, text: str) -> str:
+    # The backend is part of the key: under llama-server the model name is
+    # ignored and whatever model the server loaded answers, so its verdicts
+    # must not replay as Ollama's (or vice versa) after switching backends
+    return hashlib.sha256(
+        f"{PROMPT_VERSION}:{LLM_BACKEND}:{model_name}:{text}".encode("utf-8")
+    ).hexdigest()
+
+
+# Hard cap on profile characters sent to the model: prefill cost is linear
+# in prompt tokens and the verdict only needs the intro/experience/education
+# sections, so trimming the long tail bounds worst-case latency
+MAX_PROFILE_CHARS = 6000
+
+
+def _truncate(text: str) -> str:
+    """Cap profile text at MAX_PROFILE_CHARS, logging how much was dropped."""
+    if len(text) <= MAX_PROFILE_CHARS:
+        return text
+    print(
+        f"✂️ Truncating profile text: {len(text)} -> {MAX_PROFILE_CHARS} chars "
+        f"({MAX_PROFILE_CHARS / len(text):.0%} kept)"
+    )
+    return text[:MAX_PROFILE_CHARS] + "..."
+
+
+# Cheap keyword gate: a profile that never mentions any of these roots
+# cannot name a robotics or medical/biotech job, project, or degree, so the
+# classifier would answer NO anyway - skip the LLM entirely for it.
+# Matching is microseconds vs seconds of inference.
+_KEYWORD_RE = re.compile(
+    r"\b(robot|biotech|medic|pharma|clinic|biolog|health|biomed|mechatron|surg)\w*",
+    re.IGNORECASE,
+)
+
+
+async def generate(
+    model_name: str, prompt: str, format_schema: Optional[dict], options: dict
+) -> str:
+    """Run one completion against the configured backend, returning the raw text.
+
+    The llama-server path hits /completion directly with cache_prompt=True so
+    the shared instruction prefix is reused server-side, mirroring Ollama's
+    prefix cache; json_schema gives the same constrained decoding as format=.
+    """
+    if LLM_BACKEND == "llama-server":
+        payload = {
+            "prompt": prompt,
+            "n_predict": options.get("num_predict", -1),
+            "temperature": options.get("temperature", 0),
+            "top_k": options.get("top_k", 1),
+            "top_p": options.get("top_p", 1),
+            "repeat_penalty": options.get("repeat_penalty", 1.0),
+            "cache_prompt": True,
+        }
+        if format_schema is not None:
+            payload["json_schema"] = format_schema
+        response = await llama_server_client.post("/completion", json=payload)
+        response.raise_for_status()
+        return response.json()["content"]
+
+    response = await async_client.generate(
+        model=model_name,
+        prompt=prompt,
+        stream=False,
+        format=format_schema,
+        keep_alive=KEEP_ALIVE,
+        options=options,
+    )
+    return response["response"]
+
+
+async def warm_up_model(model_name: str):
+    """Prime the model and the prompt prefix cache with a one-token generate."""
+    print(f"🔥 Warming up {model_name} (priming prompt prefix cache)...")
+    await generate(
+        model_name, SYSTEM_PROMPT, None, {**GENERATE_OPTIONS, "num_predict": 1}
+    )
+    print("✅ Model warmed up")
+
 
 def check_ollama_connection(model_name: str, debug: bool = False) -> bool:
-    """Check if Ollama is running and the model is available."""
-    # Create Ollama client with explicit host
-    client = ollama.Client(host='http://localhost:11434')
-    response = client.list()
+    """Check if the inference backend is running and the model is available."""
+    if LLM_BACKEND == "llama-server":
+        # llama-server serves one preloaded model; just check it's healthy
+        response = httpx.get(f"{LLM_HOST}/health")
+        if response.status_code != 200:
+            print(f"llama-server at {LLM_HOST} is not healthy: {response.status_code}")
+            return False
+
+        # Unlike the Ollama path, llama-server's context is fixed at startup
+        # (and split across --parallel slots), so the per-request num_ctx
+        # safeguard can't help here: a slot too small for a full batch
+        # silently truncates the prompt and later profiles all read as NO.
+        # Warn up front instead of failing quietly per batch.
+        needed = _batch_num_ctx(["x" * (MAX_PROFILE_CHARS + 3)] * BATCH_SIZE)
+        slot_ctx = 0
+        try:
+            props = httpx.get(f"{LLM_HOST}/props").json()
+            slot_ctx = props.get("default_generation_settings", {}).get("n_ctx", 0)
+        except Exception:
+            pass
+        if slot_ctx and slot_ctx < needed:
+            print(
+                f"⚠️ llama-server slot context is {slot_ctx} tokens but a full "
+                f"batch can need ~{needed}; oversized batches will be silently "
+                f"truncated. Restart with -c >= {needed} per parallel slot "
+                f"(see README)."
+            )
+
+        print(f"Connected to llama-server at {LLM_HOST}")
+        return True
+
+    response = sync_client.list()
 
     # Handle different possible response structures
     available_models = []
@@ -54,91 +291,45 @@ def check_ollama_connection(model_name: str, debug: bool = False) -> bool:
     return True
 
 
-def analyze_text_for_interests(
+async def analyze_text_for_interests(
     text: str, model_name: str, debug: bool = False
 ) -> Tuple[bool, str, str]:
     """
     Analyze text using Ollama to detect biomedical/biotech/robotics/health tech EXPERIENCE.
 
+    Async so several profiles can be in flight at once via asyncio.gather -
+    the LLM call is seconds of network+decode latency we can overlap.
+
     Returns:
         Tuple of (has_experience, person_name, analysis_summary)
     """
-    prompt = f"""
-    CRITICAL INSTRUCTION: You MUST answer NO unless the person has CONCRETE, VERIFIABLE EXPERIENCE in ONE OF TWO CATEGORIES:
-
-    CATEGORY 1 - ROBOTICS (ANY TYPE):
-    - ANY robotics experience counts, even if NOT medical/healthcare related
-    - Robotics engineering
-    - Built robots (industrial, consumer, research, hobby, ANY type)
-    - Robotics competitions (name/year of competition)
-    - Robotics coursework or robotics degree
-    - Worked in robotics
-    - Specific robotics projects described
-    - Mechatronics, control systems for robots, robot design
-    
-    CATEGORY 2 - MEDICAL/BIOTECH/HEALTHCARE (ANY TYPE):
-    - Worked at healthcare/biotech/medical/pharma companies (job title, company name)
-    - Built healthcare/medical products, apps, or services (specific product/project)
-    - Clinical experience (doctors, nurses, healthcare providers, medical students)
-    - Founded or worked at medtech, biotech, pharmaceutical startups
-    - Medical device development (specific device or project)
-    - Bioinformatics, computational biology work (specific projects/research)
-    - Digital health, AI in healthcare projects (specific applications)
-    - Laboratory experience with biological/medical research described
-    - Degrees in biomedical engineering, biotechnology, biology, medicine, or related fields
-    - Drug development, clinical trials, medical research
-
-    SAYING "I'M INTERESTED IN" OR LISTING TOPICS AS "INTERESTS" DOES NOT COUNT AS EXPERIENCE.
-
-    IMPORTANT CLARIFICATIONS:
-    - ROBOTICS ALONE = YES (doesn't need to be medical)
-    - MEDICAL/BIOTECH ALONE = YES (doesn't need to be robotics)
-    - GENERAL ENGINEERING = NO (unless it's robotics engineering specifically)
-    - Mechanical engineering, electrical engineering, software engineering = NO (unless applied to robotics or medical/biotech)
-
-    AUTOMATICALLY ANSWER NO FOR:
-    - General "Health/Wellness" interest without specific healthcare work
-    - Listing "Biomedical/Biotech" or "Robotics" under interests WITHOUT describing actual work
-    - "Interested in healthcare" or "want to work in biotech" aspirational statements
-    - General engineering (mechanical, electrical, software) NOT applied to robotics or medical
-    - General AI/software work without specific healthcare/robotics application
-    - Wellness, fitness, meditation, nutrition apps
-    - No concrete examples of work, projects, or education in these fields
-
-    VERIFICATION TEST: If you cannot identify a SPECIFIC project, job, degree, or accomplishment in ROBOTICS (any type) OR MEDICAL/BIOTECH/HEALTHCARE from the text, the answer MUST be NO.
-
-    Text to analyze:
-    {text}
-    
-    Please respond in this exact format:
-    NAME: [person's name or "Unknown" if not found]
-    EXPERIENCE: [YES or NO]
-    SUMMARY: [List the SPECIFIC experience found (job titles, company names, projects, degrees, etc.) OR state "No specific robotics or biotech/healthcare/medical experience found - only general interest mentioned"]
-    """
+    # Truncate before the cache lookup so hits don't depend on tail length
+    text = _truncate(text)
 
-    # Create Ollama client with explicit host
-    client = ollama.Client(host='http://localhost:11434')
-    response = client.generate(model=model_name, prompt=prompt, stream=False)
+    verdict_cache = _get_verdict_cache()
+    cache_key = _cache_key(model_name, text)
+    cached = verdict_cache.get(cache_key)
+    if cached is not None:
+        print("💾 Cache hit - reusing earlier verdict for this profile")
+        return cached
 
-    analysis = response["response"]
+    # Profile text goes strictly after the cached static prefix
+    prompt = f"{SYSTEM_PROMPT}\n\nText to analyze:\n{text}"
+
+    analysis = await generate(model_name, prompt, RESPONSE_SCHEMA, GENERATE_OPTIONS)
     print(f"Ollama analysis:\n{analysis}\n")
 
-    # Parse the response
-    name_match = re.search(r"NAME:\s*(.+)", analysis)
-    experience_match = re.search(
-        r"EXPERIENCE:\s*(YES|NO)", analysis, re.IGNORECASE
-    )
-    summary_match = re.search(r"SUMMARY:\s*(.+)", analysis, re.DOTALL)
+    # Output is schema-constrained JSON, but the num_predict cap can still
+    # cut it off mid-string; degrade to an un-cached NO instead of letting
+    # the decode error unwind the whole session
+    try:
+        result = json.loads(analysis)
+    except json.JSONDecodeError as e:
+        print(f"⚠️ Malformed model response ({e}) - treating as NO, not cached")
+        return False, "Unknown", "Malformed model response - profile skipped"
 
-    person_name = name_match.group(1).strip() if name_match else "Unknown"
-    has_experience = (
-        experience_match and experience_match.group(1).upper() == "YES"
-    )
-    summary = (
-        summary_match.group(1).strip()
-        if summary_match
-        else "No summary available"
-    )
+    has_experience, person_name, summary = _result_tuple(result)
+    verdict_cache[cache_key] = (has_experience, person_name, summary)
 
     print("\n🐛 DEBUG: Parsed results:")
     print(f"🐛 DEBUG: Name extracted: '{person_name}'")
@@ -148,20 +339,136 @@ def analyze_text_for_interests(
     return has_experience, person_name, summary
 
 
+def _batch_num_ctx(texts: list) -> int:
+    """Context size that provably fits a batched prompt plus its decode budget.
+
+    3 chars/token deliberately overestimates the token count: if the prompt
+    exceeds num_ctx, Ollama silently truncates it, the model never sees the
+    later profiles, and real candidates get recorded as NO.
+    """
+    prompt_chars = (
+        len(SYSTEM_PROMPT) + sum(len(text) for text in texts) + 64 * len(texts)
+    )
+    return max(
+        GENERATE_OPTIONS["num_ctx"],
+        prompt_chars // 3 + 128 * len(texts) + 256,
+    )
+
+
+def _result_tuple(result: dict) -> Tuple[bool, str, str]:
+    """Convert one schema-constrained result dict to (has_experience, name, summary)."""
+    person_name = result.get("name", "").strip() or "Unknown"
+    has_experience = bool(result.get("experience"))
+    summary = result.get("summary", "").strip() or "No summary available"
+    return has_experience, person_name, summary
+
+
+async def analyze_batch(
+    texts: list, model_name: str, debug: bool = False
+) -> list:
+    """
+    Classify several profiles in a single generate call.
+
+    Stacking the profiles into one prompt shares the HTTP round-trip and the
+    cached instruction prefill across the whole batch, so N profiles cost far
+    less than N separate requests.
+
+    Returns:
+        One (has_experience, person_name, summary) tuple per input text,
+        in order.
+    """
+    # Truncate before the cache lookup so hits don't depend on tail length
+    texts = [_truncate(text) for text in texts]
+
+    # Serve whatever we can from the verdict cache and only send the misses
+    verdict_cache = _get_verdict_cache()
+    keys = [_cache_key(model_name, text) for text in texts]
+    verdicts = [verdict_cache.get(key) for key in keys]
+    misses = [i for i, verdict in enumerate(verdicts) if verdict is None]
+    if not misses:
+        print(f"💾 Cache hit for all {len(texts)} profiles in batch")
+        return verdicts
+
+    miss_texts = [texts[i] for i in misses]
+    sections = "\n\n".join(
+        f"### Profile {i} ###\n{text}" for i, text in enumerate(miss_texts, 1)
+    )
+    prompt = (
+        f"{SYSTEM_PROMPT}\n\n"
+        f"Classify each of the {len(miss_texts)} profiles below. Respond as JSON "
+        f'with a "results" array holding one entry per profile, in order.\n\n'
+        f"{sections}"
+    )
+
+    analysis = await generate(
+        model_name,
+        prompt,
+        BATCH_RESPONSE_SCHEMA,
+        # Scale the decode cap (one verdict's worth per profile) and the
+        # context window with the batch - 8 capped profiles far exceed the
+        # default 4096-token num_ctx
+        {
+            **GENERATE_OPTIONS,
+            "num_predict": 128 * len(miss_texts),
+            "num_ctx": _batch_num_ctx(miss_texts),
+        },
+    )
+
+    # A response truncated by the decode cap is invalid JSON; fall back to
+    # an empty result list so the whole batch reads as un-cached NOs for
+    # this pass instead of crashing the analyzer
+    try:
+        results = json.loads(analysis).get("results", [])
+    except json.JSONDecodeError as e:
+        print(f"⚠️ Malformed batch response ({e}) - treating batch as NO, not cached")
+        results = []
+    answered = len(results)
+    if debug:
+        print(
+            f"🐛 DEBUG: Batch of {len(miss_texts)} returned {answered} "
+            f"results ({len(texts) - len(miss_texts)} cache hits)"
+        )
+
+    # Pad with empty dicts if the model returned fewer entries than profiles;
+    # missing entries parse as (False, "Unknown", ...) and are just skipped
+    results += [{}] * (len(miss_texts) - answered)
+    for n, (i, result) in enumerate(zip(misses, results)):
+        verdicts[i] = _result_tuple(result)
+        # Only persist verdicts the model actually produced: caching a
+        # padded NO would permanently bury a profile it never looked at
+        if n < answered:
+            verdict_cache[keys[i]] = verdicts[i]
+    return verdicts
+
+
+# Location of the profile text block on the cofounder-matching page. CSS
+# selectors run on the browser's native (indexed) engine, unlike absolute
+# XPaths which force a full DOM traversal on every lookup.
+PROFILE_SELECTOR = (
+    "body > div > div:nth-of-type(2) > div:nth-of-type(2) > div > div"
+    " > div:nth-of-type(1) > div:nth-of-type(1)"
+)
+
+
 def get_page_text(driver, debug: bool = False) -> str:
-    """Get profile text content from the specific XPath location."""
-    print("📄 Extracting profile text from XPath...")
-    
-    # Wait for the profile content to load and extract text from specific XPath
+    """Get profile text content from the profile block."""
+    print("📄 Extracting profile text...")
+
+    # Wait for the profile content to load, then extract its text
     wait = WebDriverWait(driver, 10)
     profile_element = wait.until(
-        EC.presence_of_element_located((By.XPATH, "/html/body/div/div[2]/div[2]/div/div/div[1]/div[1]"))
+        EC.presence_of_element_located((By.CSS_SELECTOR, PROFILE_SELECTOR))
+    )
+
+    # One JS call instead of Selenium's .text, which walks the element's
+    # children with a WebDriver round-trip per node
+    text = driver.execute_script(
+        "return arguments[0].innerText || arguments[0].textContent;",
+        profile_element,
     )
-    
-    text = profile_element.text
     
     if debug:
-        print(f"� DEBUG: XPath element found and extracted")
+        print(f"� DEBUG: Profile element found and extracted")
         print(f"🐛 DEBUG: First 200 chars: {text[:200]}...")
     
     print(f"✅ Extracted {len(text)} characters from profile section")
@@ -181,6 +488,27 @@ def get_profile_url(driver, debug: bool = False) -> str:
 
 
 
+def _find_skip_button(driver):
+    """Find the clickable 'skip for now' button, or None if not present yet.
+
+    One find_elements scan plus Python-side text matching; Chrome's XPath
+    engine handles contains(text()) noticeably slower than this.
+    """
+    for button in driver.find_elements(By.TAG_NAME, "button"):
+        try:
+            if (
+                button.text.strip().lower().startswith("skip for now")
+                and button.is_displayed()
+                and button.is_enabled()
+            ):
+                return button
+        except StaleElementReferenceException:
+            # The SPA re-rendered between find_elements and the property
+            # read; skip this handle and let the wait retry the scan
+            continue
+    return None
+
+
 def click_skip_button(driver, debug: bool = False) -> bool:
     """Click the skip button to move to next profile."""
     print("⏭️ Looking for skip button...")
@@ -188,21 +516,46 @@ def click_skip_button(driver, debug: bool = False) -> bool:
 
     # Wait for and find the skip button with text "skip for now"
     wait = WebDriverWait(driver, 10)
-    skip_button = wait.until(
-        EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'skip for now') or contains(text(), 'Skip for now')]"))
-    )
-    
+    skip_button = wait.until(_find_skip_button)
+
     if debug:
         print("🐛 DEBUG: Found skip button, clicking...")
-    
+
+    # Capture the current profile's element and text so we can wait for it
+    # to be replaced OR rewritten instead of sleeping a fixed 2 seconds -
+    # the SPA often swaps content in place without detaching the node, in
+    # which case a staleness wait would burn its whole timeout
+    old_profile = driver.find_element(By.CSS_SELECTOR, PROFILE_SELECTOR)
+    old_text = driver.execute_script(
+        "return arguments[0].innerText;", old_profile
+    )
     skip_button.click()
-    time.sleep(2)  # Wait for page to load
-    
+
+    def profile_changed(d):
+        try:
+            new_text = d.execute_script(
+                "return arguments[0].innerText;", old_profile
+            )
+        except StaleElementReferenceException:
+            # Old node detached: the profile was replaced outright
+            return True
+        return new_text != old_text
+
+    try:
+        WebDriverWait(driver, 5).until(profile_changed)
+    except TimeoutException:
+        print("⚠️ Profile content unchanged after skip - next read may repeat this profile")
+
     print("✅ Moved to next profile")
     return True
 
 
 
+# Running total of saved candidates, tracked in memory so we never have to
+# re-read the output file just to count entries
+_candidate_count = 0
+
+
 def save_candidate_to_file(
     person_name: str,
     url: str,
@@ -210,9 +563,10 @@ def save_candidate_to_file(
     filename: str = "recommended_candidates.txt",
 ):
     """Save recommended candidate information to a text file."""
-    import os
     from datetime import datetime
 
+    global _candidate_count
+
     # Create entry
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     entry = f"""
@@ -229,74 +583,126 @@ Reason: {summary}
     with open(filename, "a", encoding="utf-8") as f:
         f.write(entry)
 
+    _candidate_count += 1
     print(f"💾 Saved {person_name} to {filename}")
-
-    # Show file info
-    if os.path.exists(filename):
-        with open(filename, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-            candidate_count = len(
-                [line for line in lines if line.startswith("Name:")]
-            )
-        print(f"📊 Total candidates saved: {candidate_count}")
+    print(f"📊 Total candidates saved: {_candidate_count}")
 
 
-def main(model: str = "llama3.2", debug: bool = False):
-    """Main execution function."""
-    print("🤖 YC Cofounder Matcher Bot Starting...")
-    print("📝 URL Collection Mode - Saving recommended candidates to file")
-    print("🌐 Using Selenium WebDriver for browser automation")
-
-    # Check Ollama connection
-    if not check_ollama_connection(model, debug):
-        print(
-            "❌ Cannot connect to Ollama. Make sure it's running and the model is available."
-        )
-        return False
+# Sentinel the scraper pushes when it stops (end of deck, layout change,
+# logged out) so the analyzer never blocks forever on an empty queue
+_SCRAPE_DONE = object()
 
-    # Initialize Selenium WebDriver
-    print("\n🚀 Starting browser...")
 
-    driver = webdriver.Chrome()  # You can change to Firefox() if preferred
-    driver.maximize_window()
+def scrape_profiles(driver, profile_queue: queue.Queue, debug: bool = False):
+    """Scrape profiles in a background thread and feed them to the analyzer.
 
+    All WebDriver calls live in this thread (Selenium drivers are not
+    thread-safe), so it scrapes profile k+1 while the LLM is still busy
+    analyzing profile k. Always pushes _SCRAPE_DONE before exiting; it
+    never prompts for input (that would contend with the consumer's
+    debug-mode prompt), so any scrape failure just ends the session.
+    """
     try:
-        # Navigate to YC Startup School
-        print("🌐 Navigating to Y Combinator Startup School...")
-        driver.get("https://www.startupschool.org/cofounder-matching")
-        
-        print("\n=== MANUAL LOGIN REQUIRED ===")
-        print("Please complete the following steps manually:")
-        print("1. Log in to your Y Combinator account")
-        print("2. Navigate to the cofounder matching section")
-        print("3. Go to the first profile you want to analyze")
-        print("4. Make sure you're on a candidate profile page")
-        
-        input("\nPress Enter when you're logged in and on the first candidate profile...")
-
-        profile_count = 0
-
         while True:
-            profile_count += 1
-            print(f"\n🔍 Analyzing profile #{profile_count}...")
-
-            # Get page content automatically
             page_text = get_page_text(driver, debug)
             if not page_text:
                 print("❌ Could not get page content. Skipping this profile.")
-                if not click_skip_button(driver, debug):
-                    print("❌ Could not skip profile. Manual intervention required.")
-                    input("Please navigate to the next profile manually and press Enter...")
+                click_skip_button(driver, debug)
                 continue
 
-            print(
-                f"📄 Analyzing profile content ({len(page_text)} characters)..."
+            # Capture the URL before we skip away from the profile
+            profile_url = get_profile_url(driver, debug)
+            profile_queue.put((page_text, profile_url))
+
+            # Click skip button to move to next profile
+            click_skip_button(driver, debug)
+    except Exception as e:
+        print(f"❌ Scraper stopped ({type(e).__name__}): {e}")
+        print("   (end of deck, page layout change, or logged out)")
+    finally:
+        profile_queue.put(_SCRAPE_DONE)
+
+
+async def analyze_profiles(
+    profile_queue: queue.Queue, model: str, debug: bool = False
+) -> int:
+    """Pull scraped profiles off the queue and analyze them in batches.
+
+    Up to BATCH_SIZE profiles are classified in a single FAST_MODEL request;
+    the rare YES verdicts are then confirmed concurrently with `model`
+    before a candidate is saved.
+    """
+    profile_count = 0
+
+    # One-time warm-up so the first real profile already hits the prefix
+    # cache. Only the fast model is warmed; the verify model loads lazily
+    # on the first confirmed-YES candidate.
+    await warm_up_model(FAST_MODEL)
+
+    # Bound verify-pass concurrency to what the server can actually serve
+    # in parallel
+    verify_semaphore = asyncio.Semaphore(CONCURRENT_PROFILES)
+
+    async def verify(page_text):
+        async with verify_semaphore:
+            return await analyze_text_for_interests(page_text, model, debug)
+
+    scraper_done = False
+    while not scraper_done:
+        # Block for the first profile, then drain whatever else is ready
+        first = await asyncio.to_thread(profile_queue.get)
+        if first is _SCRAPE_DONE:
+            scraper_done = True
+            continue
+        batch = [first]
+        while len(batch) < BATCH_SIZE:
+            try:
+                item = profile_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _SCRAPE_DONE:
+                scraper_done = True
+                break
+            batch.append(item)
+
+        # Keyword gate: profiles without any relevant root go straight to NO
+        results: list = [None] * len(batch)
+        to_analyze = []
+        for i, (page_text, _) in enumerate(batch):
+            if _KEYWORD_RE.search(page_text):
+                to_analyze.append(i)
+            else:
+                results[i] = (
+                    False,
+                    "Unknown",
+                    "No robotics or medical/biotech keywords in profile - skipped LLM analysis",
+                )
+
+        # First pass: one batched request classifies the remaining profiles
+        if to_analyze:
+            analyzed = await analyze_batch(
+                [batch[i][0] for i in to_analyze], FAST_MODEL, debug
             )
+            for i, result in zip(to_analyze, analyzed):
+                results[i] = result
 
-            # Analyze text for experience
-            has_experience, person_name, summary = analyze_text_for_interests(
-                page_text, model, debug
+        # Confirm flagged profiles concurrently with the big model
+        flagged = [i for i, (has_experience, _, _) in enumerate(results) if has_experience]
+        if flagged:
+            print(
+                f"🔁 {FAST_MODEL} flagged {len(flagged)} profile(s), confirming with {model}..."
+            )
+            verified = await asyncio.gather(
+                *[verify(batch[i][0]) for i in flagged]
             )
+            for i, result in zip(flagged, verified):
+                results[i] = result
+
+        for (page_text, profile_url), (has_experience, person_name, summary) in zip(
+            batch, results
+        ):
+            profile_count += 1
+            print(f"\n🔍 Profile #{profile_count} ({len(page_text)} characters)")
 
             print("\n=== ANALYSIS RESULTS ===")
             print(f"Name: {person_name}")
@@ -308,9 +714,6 @@ def main(model: str = "llama3.2", debug: bool = False):
                     f"\n✅ {person_name} has relevant experience in biotech/health tech/robotics!"
                 )
 
-                # Get the profile URL
-                profile_url = get_profile_url(driver, debug)
-
                 # Save to file
                 save_candidate_to_file(person_name, profile_url, summary)
 
@@ -321,29 +724,75 @@ def main(model: str = "llama3.2", debug: bool = False):
                 )
                 print("Skipping this candidate.")
 
-            # In debug mode, ask user for confirmation
-            if debug:
-                print(f"\n🔄 Ready to move to next profile...")
-                response = input(
-                    "Continue to next profile? (y/N/q to quit): "
-                ).lower()
-
-                if response == "q":
-                    print("🛑 Stopping automation as requested.")
-                    break
-                elif response != "y":
-                    print("❌ Automation cancelled by user.")
-                    break
-            else:
-                print(f"\n🔄 Moving to next profile automatically...")
-                time.sleep(1)  # Brief pause between profiles
+        # In debug mode, ask user for confirmation between batches
+        if debug:
+            print(f"\n🔄 Ready to analyze next profiles...")
+            response = input(
+                "Continue to next profiles? (y/N/q to quit): "
+            ).lower()
 
-            # Click skip button to move to next profile
-            if not click_skip_button(driver, debug):
-                print("❌ Could not find skip button. Manual intervention required.")
-                input("Please click 'skip for now' manually and press Enter...")
+            if response == "q":
+                print("🛑 Stopping automation as requested.")
+                break
+            elif response != "y":
+                print("❌ Automation cancelled by user.")
+                break
+
+    if scraper_done:
+        print("🛑 Scraper has stopped - no more profiles to analyze.")
+    return profile_count
+
+
+def main(model: str = VERIFY_MODEL, debug: bool = False):
+    """Main execution function."""
+    print("🤖 YC Cofounder Matcher Bot Starting...")
+    print("📝 URL Collection Mode - Saving recommended candidates to file")
+    print("🌐 Using Selenium WebDriver for browser automation")
+
+    # Check Ollama connection - both the fast first-pass model and the
+    # verify model need to be available
+    for model_name in (FAST_MODEL, model):
+        if not check_ollama_connection(model_name, debug):
+            print(
+                "❌ Cannot connect to Ollama. Make sure it's running and the model is available."
+            )
+            return False
 
+    # Initialize Selenium WebDriver
+    print("\n🚀 Starting browser...")
 
+    driver = webdriver.Chrome()  # You can change to Firefox() if preferred
+    driver.maximize_window()
+
+    try:
+        # Navigate to YC Startup School
+        print("🌐 Navigating to Y Combinator Startup School...")
+        driver.get("https://www.startupschool.org/cofounder-matching")
+        
+        print("\n=== MANUAL LOGIN REQUIRED ===")
+        print("Please complete the following steps manually:")
+        print("1. Log in to your Y Combinator account")
+        print("2. Navigate to the cofounder matching section")
+        print("3. Go to the first profile you want to analyze")
+        print("4. Make sure you're on a candidate profile page")
+        
+        input("\nPress Enter when you're logged in and on the first candidate profile...")
+
+        # Scraper thread feeds profiles to the async analyzer so Selenium
+        # scraping and LLM inference overlap instead of running serially.
+        # The bound keeps the scraper at most one analysis batch ahead, so a
+        # slow LLM doesn't let it churn through profiles unchecked.
+        profile_queue: queue.Queue = queue.Queue(maxsize=BATCH_SIZE)
+        scraper = threading.Thread(
+            target=scrape_profiles,
+            args=(driver, profile_queue, debug),
+            daemon=True,
+        )
+        scraper.start()
+
+        profile_count = asyncio.run(
+            analyze_profiles(profile_queue, model, debug)
+        )
 
         print(f"\n📊 Session Summary:")
         print(f"   Profiles analyzed: {profile_count}")
@@ -360,4 +809,4 @@ def main(model: str = "llama3.2", debug: bool = False):
 
 if __name__ == "__main__":
     # Default execution - you can change these defaults
-    main(model="qwen2.5:32b", debug=False)
+    main(model=VERIFY_MODEL, debug=False)